@@ -13,6 +13,11 @@ Usage:
   if not pyperclip.is_available():
     print("Copy functionality unavailable!")
 
+copy() also accepts UTF-8 encoded bytes; invalid UTF-8 raises
+PyperclipException. Backends that run a program (xclip, pbcopy, ...) hand
+the bytes over as-is. Pure-ASCII bytes are not decoded at all; other bytes
+are decoded once to check that they are valid UTF-8.
+
 On Windows, no additional modules are needed.
 On Mac, the pyobjc module is used, falling back to the pbcopy and pbpaste cli
     commands. (These commands should come with OS X.).
@@ -47,16 +52,22 @@ Pyperclip into running them with whatever permissions the Python process has.
 """
 __version__ = '1.9.4'
 
+import atexit
+import base64
 import contextlib
 import ctypes
+import functools
+import importlib.util
 import os
 import platform
 import subprocess
 import sys
+import threading
 import time
+import types
 import warnings
 
-from ctypes import c_size_t, sizeof, c_wchar_p, get_errno, c_wchar
+from ctypes import c_size_t, c_wchar_p, get_errno
 
 EXCEPT_MSG = """
     Pyperclip could not find a copy/paste mechanism for your system.
@@ -64,19 +75,59 @@ EXCEPT_MSG = """
 
 ENCODING = 'utf-8'
 
+# Run by a long-lived powershell.exe in init_wsl_clipboard().
+_WSL_PASTE_SCRIPT = (
+    "while ($null -ne [Console]::In.ReadLine()) {"
+    " $c = Get-Clipboard -Raw;"
+    " if ($null -eq $c) { $c = '' };"
+    " [Console]::Out.WriteLine([Convert]::ToBase64String([Text.Encoding]::UTF8.GetBytes($c)));"
+    " [Console]::Out.Flush()"
+    " }")
+
+# The platform can't change while the process runs, so it is only looked up once.
+_SYSTEM = platform.system()
+# Cygwin has a variety of values returned by platform.system(), such as 'CYGWIN_NT-6.1'
+_IS_CYGWIN = 'cygwin' in _SYSTEM.lower()
+_IS_WINDOWS = os.name == 'nt' or _SYSTEM == 'Windows'
+_IS_MACOS = os.name == 'mac' or _SYSTEM == 'Darwin'
+
+
+def _detect_wsl():
+    if _SYSTEM != 'Linux' or not os.path.isfile('/proc/version'):
+        return False
+    with open('/proc/version', 'r') as f:
+        return "microsoft" in f.read().lower()
+
+
+_IS_WSL = _detect_wsl()
+
+# Lookups are memoized so that repeated calls to determine_clipboard() don't
+# walk $PATH (or spawn "which") again. Call _executable_exists.cache_clear()
+# if executables are installed or removed while the process is running.
 try:
-    from shutil import which as _executable_exists
+    from shutil import which as _which
 except ImportError:
     # The "which" unix command finds where a command is.
-    if platform.system() == 'Windows':
+    if _SYSTEM == 'Windows':
         WHICH_CMD = 'where'
     else:
         WHICH_CMD = 'which'
 
 
-    def _executable_exists(name):
+    def _which(name):
         return subprocess.call([WHICH_CMD, name],
-                               stdout=subprocess.PIPE, stderr=subprocess.PIPE) == 0
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL) == 0
+
+_executable_exists = functools.lru_cache(maxsize=32)(_which)
+
+
+def _module_exists(name):
+    # Checks for an installed module without importing it, so probing for
+    # heavy backends like PyQt5 or AppKit doesn't load them.
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
 
 
 # Exceptions
@@ -94,43 +145,73 @@ class PyperclipTimeoutException(PyperclipException):
     pass
 
 
+_ACCEPTED_TYPES = (str, int, float, bool)
+
+
+def _decodeBytes(data):
+    try:
+        return data.decode(ENCODING)
+    except UnicodeDecodeError as e:
+        raise PyperclipException(f'bytes values copied to the clipboard must be valid {ENCODING}: {e}') from e
+
+
 def _stringifyText(text):
-    acceptedTypes = (str, int, float, bool)
-    if not isinstance(text, acceptedTypes):
+    if type(text) is str:
+        return text
+    if isinstance(text, (bytes, bytearray)):
+        return _decodeBytes(text)
+    if not isinstance(text, _ACCEPTED_TYPES):
         raise PyperclipException(
-            f'only str, int, float, and bool values can be copied to the clipboard, not {text.__class__.__name__}')
+            f'only str, bytes, int, float, and bool values can be copied to the clipboard, not {text.__class__.__name__}')
     return str(text)
 
 
+def _encodeText(text):
+    # Like _stringifyText(), but for backends that pass the text on to another
+    # program. Values that are already bytes are used as-is instead of being
+    # decoded and encoded again. They are still checked to be valid UTF-8 so
+    # every backend accepts the same values; pure ASCII needs no decoding.
+    if isinstance(text, (bytes, bytearray)):
+        if not text.isascii():
+            _decodeBytes(text)
+        return text
+    return _stringifyText(text).encode(ENCODING)
+
+
 def init_osx_pbcopy_clipboard():
     def copy_osx_pbcopy(text):
-        text = _stringifyText(text)  # Converts non-str values to str.
+        data = _encodeText(text)  # Converts non-str values to bytes.
         p = subprocess.Popen(['pbcopy', 'w'],
                              stdin=subprocess.PIPE, close_fds=True)
-        p.communicate(input=text.encode(ENCODING))
+        p.communicate(input=data)
 
     def paste_osx_pbcopy(errors='strict'):
         p = subprocess.Popen(['pbpaste', 'r'],
-                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=True)
-        stdout, stderr = p.communicate()
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, close_fds=True)
+        stdout, _ = p.communicate()
         return stdout.decode(ENCODING, errors)
 
     return copy_osx_pbcopy, paste_osx_pbcopy
 
 
 def init_osx_pyobjc_clipboard():
+    global Foundation, AppKit
+    import Foundation
+    import AppKit
+
+    # The general pasteboard is a shared singleton, so fetch it only once.
+    board = AppKit.NSPasteboard.generalPasteboard()
+
     def copy_osx_pyobjc(text):
         '''Copy string argument to clipboard'''
         text = _stringifyText(text)  # Converts non-str values to str.
         newStr = Foundation.NSString.stringWithString_(text).nsstring()
         newData = newStr.dataUsingEncoding_(Foundation.NSUTF8StringEncoding)
-        board = AppKit.NSPasteboard.generalPasteboard()
         board.declareTypes_owner_([AppKit.NSStringPboardType], None)
         board.setData_forType_(newData, AppKit.NSStringPboardType)
 
     def paste_osx_pyobjc():
         "Returns contents of clipboard"
-        board = AppKit.NSPasteboard.generalPasteboard()
         content = board.stringForType_(AppKit.NSStringPboardType)
         return content
 
@@ -163,28 +244,37 @@ def init_qt_clipboard():
     return copy_qt, paste_qt
 
 
-def init_xclip_clipboard():
-    DEFAULT_SELECTION = 'c'
-    PRIMARY_SELECTION = 'p'
+# Command lines for the X11 and Wayland tools, built once.
+_XCLIP_COPY_C = ('xclip', '-selection', 'c')
+_XCLIP_COPY_P = ('xclip', '-selection', 'p')
+_XCLIP_PASTE_C = ('xclip', '-selection', 'c', '-o')
+_XCLIP_PASTE_P = ('xclip', '-selection', 'p', '-o')
+_XSEL_COPY_B = ('xsel', '-b', '-i')
+_XSEL_COPY_P = ('xsel', '-p', '-i')
+_XSEL_PASTE_B = ('xsel', '-b', '-o')
+_XSEL_PASTE_P = ('xsel', '-p', '-o')
+_WL_COPY = ('wl-copy',)
+_WL_COPY_P = ('wl-copy', '-p')
+_WL_CLEAR = ('wl-copy', '--clear')
+_WL_CLEAR_P = ('wl-copy', '-p', '--clear')
+_WL_PASTE = ('wl-paste', '-n', '-t', 'text')
+_WL_PASTE_P = ('wl-paste', '-n', '-t', 'text', '-p')
+_WL_WATCH = ('wl-paste', '-t', 'text', '--watch', 'sh', '-c', 'base64 -w0; echo')
 
+
+def init_xclip_clipboard():
     def copy_xclip(text, primary=False):
-        text = _stringifyText(text)  # Converts non-str values to str.
-        selection = DEFAULT_SELECTION
-        if primary:
-            selection = PRIMARY_SELECTION
-        p = subprocess.Popen(['xclip', '-selection', selection],
+        data = _encodeText(text)  # Converts non-str values to bytes.
+        p = subprocess.Popen(_XCLIP_COPY_P if primary else _XCLIP_COPY_C,
                              stdin=subprocess.PIPE, close_fds=True)
-        p.communicate(input=text.encode(ENCODING))
+        p.communicate(input=data)
 
     def paste_xclip(primary=False):
-        selection = DEFAULT_SELECTION
-        if primary:
-            selection = PRIMARY_SELECTION
-        p = subprocess.Popen(['xclip', '-selection', selection, '-o'],
+        p = subprocess.Popen(_XCLIP_PASTE_P if primary else _XCLIP_PASTE_C,
                              stdout=subprocess.PIPE,
-                             stderr=subprocess.PIPE,
+                             stderr=subprocess.DEVNULL,
                              close_fds=True)
-        stdout, stderr = p.communicate()
+        stdout, _ = p.communicate()
         # Intentionally ignore extraneous output on stderr when clipboard is empty
         return stdout.decode(ENCODING)
 
@@ -192,52 +282,88 @@ def init_xclip_clipboard():
 
 
 def init_xsel_clipboard():
-    DEFAULT_SELECTION = '-b'
-    PRIMARY_SELECTION = '-p'
-
     def copy_xsel(text, primary=False):
-        text = _stringifyText(text)  # Converts non-str values to str.
-        selection_flag = DEFAULT_SELECTION
-        if primary:
-            selection_flag = PRIMARY_SELECTION
-        p = subprocess.Popen(['xsel', selection_flag, '-i'],
+        data = _encodeText(text)  # Converts non-str values to bytes.
+        p = subprocess.Popen(_XSEL_COPY_P if primary else _XSEL_COPY_B,
                              stdin=subprocess.PIPE, close_fds=True)
-        p.communicate(input=text.encode(ENCODING))
+        p.communicate(input=data)
 
     def paste_xsel(primary=False):
-        selection_flag = DEFAULT_SELECTION
-        if primary:
-            selection_flag = PRIMARY_SELECTION
-        p = subprocess.Popen(['xsel', selection_flag, '-o'],
-                             stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=True)
-        stdout, stderr = p.communicate()
+        p = subprocess.Popen(_XSEL_PASTE_P if primary else _XSEL_PASTE_B,
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, close_fds=True)
+        stdout, _ = p.communicate()
         return stdout.decode(ENCODING)
 
     return copy_xsel, paste_xsel
 
 
-def init_wl_clipboard():
-    PRIMARY_SELECTION = "-p"
+def init_wl_clipboard(watch=False):
+    # With watch=True (set_clipboard("wl-clipboard-watch")), rather than
+    # running wl-paste for every paste, a single "wl-paste --watch" process
+    # reports each new clipboard selection as one line of base64, which a
+    # background thread keeps in `watched`. `watched` is None while the
+    # contents are unknown, in which case paste_wl() runs wl-paste itself.
+    # After copy_wl(), reports are ignored until the watcher has seen our own
+    # write (`pending`), since older reports may still be in flight.
+    # The primary selection isn't watched.
+    watcher = None
+    watched = None
+    pending = None
+    watch_lock = threading.Lock()
+
+    def watch_clipboard(process):
+        nonlocal watched, pending
+        for line in process.stdout:
+            try:
+                data = base64.b64decode(line)
+                text = data.decode(ENCODING)
+            except ValueError:
+                data = text = None
+            with watch_lock:
+                if pending is not None:
+                    if data != pending:
+                        continue
+                    pending = None
+                watched = text
+        with watch_lock:
+            watched = None
+
+    def start_watcher():
+        nonlocal watcher
+        with watch_lock:
+            if watcher is not None:
+                return
+            watcher = subprocess.Popen(_WL_WATCH, stdout=subprocess.PIPE,
+                                       stderr=subprocess.DEVNULL,
+                                       stdin=subprocess.DEVNULL, close_fds=True)
+        atexit.register(watcher.terminate)
+        threading.Thread(target=watch_clipboard, args=(watcher,), daemon=True).start()
 
     def copy_wl(text, primary=False):
-        text = _stringifyText(text)  # Converts non-str values to str.
-        args = ["wl-copy"]
-        if primary:
-            args.append(PRIMARY_SELECTION)
-        if not text:
-            args.append('--clear')
-            subprocess.check_call(args, close_fds=True)
+        nonlocal watched, pending
+        data = _encodeText(text)  # Converts non-str values to bytes.
+        if not primary:
+            with watch_lock:
+                if watcher is not None:
+                    watched = None
+                    pending = bytes(data)
+        if not data:
+            subprocess.check_call(_WL_CLEAR_P if primary else _WL_CLEAR, close_fds=True)
         else:
-            pass
-            p = subprocess.Popen(args, stdin=subprocess.PIPE, close_fds=True)
-            p.communicate(input=text.encode(ENCODING))
+            p = subprocess.Popen(_WL_COPY_P if primary else _WL_COPY,
+                                 stdin=subprocess.PIPE, close_fds=True)
+            p.communicate(input=data)
 
     def paste_wl(primary=False):
-        args = ["wl-paste", "-n", "-t", "text"]
-        if primary:
-            args.append(PRIMARY_SELECTION)
-        p = subprocess.Popen(args, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=True)
-        stdout, _stderr = p.communicate()
+        if watch and not primary:
+            if watcher is None and _executable_exists("base64"):
+                start_watcher()
+            text = watched
+            if text is not None:
+                return text
+
+        p = subprocess.Popen(_WL_PASTE_P if primary else _WL_PASTE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, close_fds=True)
+        stdout, _ = p.communicate()
         return stdout.decode(ENCODING)
 
     return copy_wl, paste_wl
@@ -245,27 +371,31 @@ def init_wl_clipboard():
 
 def init_gpaste_clipboard():
     def start_client_gpaste():
-        args = ['gpaste-client daemon-reexec & exit']
-        result = subprocess.run(args, capture_output=True, text=True, shell=True)
-        args = ["gpaste-client start & exit"]
-        result = subprocess.run(args, capture_output=True, text=True, shell=True)
+        for command in ('daemon-reexec', 'start'):
+            subprocess.run(['gpaste-client', command],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                           close_fds=True)
 
     def copy_gpaste(text):
-        text = _stringifyText(text)  # Converts non-str values to str.
+        data = _encodeText(text)  # Converts non-str values to bytes.
         args = ["gpaste-client"]
-        if not text:
+        if not data:
             args.append('delete-history')
             subprocess.check_call(args, close_fds=True)
         else:
             args.append('add')
             p = subprocess.Popen(args, stdin=subprocess.PIPE, close_fds=True)
-            p.communicate(input=text.encode(ENCODING))
+            p.communicate(input=data)
 
     def paste_gpaste():
-        args = ["gpaste-client history --raw & exit"]
-        result = subprocess.run(args, capture_output=True, text=True, shell=True)
-        last_item_in_history = [str(x).strip() for x in result.stdout.splitlines()][0]
-        return last_item_in_history
+        # Only the first line of the history (the latest item) is needed,
+        # so stop reading there.
+        p = subprocess.Popen(['gpaste-client', 'history', '--raw'],
+                             stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, close_fds=True)
+        last_item_in_history = p.stdout.readline()
+        p.stdout.close()
+        p.wait()
+        return last_item_in_history.decode(ENCODING).strip()
 
     start_client_gpaste()
     return copy_gpaste, paste_gpaste
@@ -273,45 +403,76 @@ def init_gpaste_clipboard():
 
 def init_klipper_clipboard():
     def copy_klipper(text):
-        text = _stringifyText(text)  # Converts non-str values to str.
+        data = _encodeText(text)  # Converts non-str values to bytes.
         p = subprocess.Popen(
             ['qdbus', 'org.kde.klipper', '/klipper', 'setClipboardContents',
-             text.encode(ENCODING)],
+             bytes(data)],
             stdin=subprocess.PIPE, close_fds=True)
         p.communicate(input=None)
 
     def paste_klipper():
         p = subprocess.Popen(
             ['qdbus', 'org.kde.klipper', '/klipper', 'getClipboardContents'],
-            stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=True)
-        stdout, stderr = p.communicate()
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, close_fds=True)
+        stdout, _ = p.communicate()
 
-        clipboardContents = stdout.decode(ENCODING)
-        if clipboardContents.endswith('\n'):
-            clipboardContents = clipboardContents[:-1]
-        return clipboardContents
+        # qdbus appends a newline; strip it before decoding.
+        if stdout.endswith(b'\n'):
+            stdout = stdout[:-1]
+        return stdout.decode(ENCODING)
+
+    # If dbus-python is installed, talk to klipper over a single session bus
+    # connection instead of running qdbus for every copy and paste.
+    try:
+        import dbus
+        klipper = dbus.Interface(
+            dbus.SessionBus().get_object('org.kde.klipper', '/klipper'),
+            'org.kde.klipper.klipper')
+    except Exception:
+        return copy_klipper, paste_klipper
+
+    def copy_klipper_dbus(text):
+        text = _stringifyText(text)  # Converts non-str values to str.
+        klipper.setClipboardContents(text)
 
-    return copy_klipper, paste_klipper
+    def paste_klipper_dbus():
+        return str(klipper.getClipboardContents())
+
+    return copy_klipper_dbus, paste_klipper_dbus
 
 
 def init_dev_clipboard_clipboard():
     def copy_dev_clipboard(text):
-        text = _stringifyText(text)  # Converts non-str values to str.
-        if text == '':
+        data = _encodeText(text)  # Converts non-str values to bytes.
+        if not data:
             warnings.warn(
                 'Pyperclip cannot copy a blank string to the clipboard on Cygwin. This is effectively a no-op.')
-        if '\r' in text:
+        if b'\r' in data:
             warnings.warn('Pyperclip cannot handle \\r characters on Cygwin.')
 
-        fo = open('/dev/clipboard', 'wt')
-        fo.write(text)
-        fo.close()
+        # Raw file descriptors skip the buffered text IO layers of open().
+        fd = os.open('/dev/clipboard', os.O_WRONLY | os.O_TRUNC)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
 
     def paste_dev_clipboard():
-        fo = open('/dev/clipboard', 'rt')
-        content = fo.read()
-        fo.close()
-        return content
+        fd = os.open('/dev/clipboard', os.O_RDONLY)
+        try:
+            chunks = []
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+        # Translate newlines like open()'s text mode (universal newlines) did.
+        content = b''.join(chunks).decode(ENCODING)
+        return content.replace('\r\n', '\n').replace('\r', '\n')
 
     return copy_dev_clipboard, paste_dev_clipboard
 
@@ -349,7 +510,6 @@ def init_windows_clipboard():
                                  HINSTANCE, HMENU, BOOL, UINT, HANDLE)
 
     windll = ctypes.windll
-    msvcrt = ctypes.CDLL('msvcrt')
 
     safeCreateWindowExA = CheckedCall(windll.user32.CreateWindowExA)
     safeCreateWindowExA.argtypes = [DWORD, LPCSTR, LPCSTR, DWORD, INT, INT,
@@ -392,10 +552,6 @@ def init_windows_clipboard():
     safeGlobalUnlock.argtypes = [HGLOBAL]
     safeGlobalUnlock.restype = BOOL
 
-    wcslen = CheckedCall(msvcrt.wcslen)
-    wcslen.argtypes = [c_wchar_p]
-    wcslen.restype = UINT
-
     GMEM_MOVEABLE = 0x0002
     CF_UNICODETEXT = 13
 
@@ -404,6 +560,9 @@ def init_windows_clipboard():
         """
         Context that provides a valid Windows hwnd.
         """
+        # A window belongs to the thread that created it, and ours must not
+        # stay the clipboard owner without pumping messages, so a new one is
+        # created for every copy.
         # we really just need the hwnd, so setting "STATIC"
         # as predefined lpClass is just fine.
         hwnd = safeCreateWindowExA(0, b"STATIC", None, 0, 0, 0, 0, 0,
@@ -421,14 +580,17 @@ def init_windows_clipboard():
         """
         # We may not get the clipboard handle immediately because
         # some other application is accessing it (?)
-        # We try for at least 500ms to get the clipboard.
-        t = time.time() + 0.5
+        # We try for at least 500ms to get the clipboard, backing off
+        # exponentially so that short contention is retried quickly.
+        t = time.monotonic() + 0.5
+        delay = 0.0005
         success = False
-        while time.time() < t:
+        while time.monotonic() < t:
             success = OpenClipboard(hwnd)
             if success:
                 break
-            time.sleep(0.01)
+            time.sleep(delay)
+            delay = min(delay * 2, 0.01)
         if not success:
             raise PyperclipWindowsException("Error calling OpenClipboard")
 
@@ -457,12 +619,15 @@ def init_windows_clipboard():
                     # If the hMem parameter identifies a memory object,
                     # the object must have been allocated using the
                     # function with the GMEM_MOVEABLE flag.
-                    count = wcslen(text) + 1
-                    handle = safeGlobalAlloc(GMEM_MOVEABLE,
-                                             count * sizeof(c_wchar))
+                    # Encoding to UTF-16 sizes the buffer in code units, so
+                    # characters outside the BMP are accounted for. Two more
+                    # bytes hold the terminating NUL.
+                    data = text.encode('utf-16-le')
+                    handle = safeGlobalAlloc(GMEM_MOVEABLE, len(data) + 2)
                     locked_handle = safeGlobalLock(handle)
 
-                    ctypes.memmove(c_wchar_p(locked_handle), c_wchar_p(text), count * sizeof(c_wchar))
+                    ctypes.memmove(locked_handle, data, len(data))
+                    ctypes.memset(locked_handle + len(data), 0, 2)
 
                     safeGlobalUnlock(handle)
                     safeSetClipboardData(CF_UNICODETEXT, handle)
@@ -486,20 +651,57 @@ def init_windows_clipboard():
 
 def init_wsl_clipboard():
     def copy_wsl(text):
-        text = _stringifyText(text)  # Converts non-str values to str.
+        data = _encodeText(text)  # Converts non-str values to bytes.
         p = subprocess.Popen(['clip.exe'],
                              stdin=subprocess.PIPE, close_fds=True)
-        p.communicate(input=text.encode(ENCODING))
+        p.communicate(input=data)
+
+    # Starting PowerShell takes a large fraction of a second, so a single
+    # instance is kept running. Each line written to its stdin makes it print
+    # the clipboard contents as one line of base64; it exits once stdin closes.
+    helper = None
+    helper_lock = threading.Lock()
+
+    def paste_helper():
+        nonlocal helper
+        with helper_lock:
+            try:
+                if helper is None or helper.poll() is not None:
+                    # '-noprofile' speeds up load time
+                    helper = subprocess.Popen(['powershell.exe', '-noprofile', '-command', _WSL_PASTE_SCRIPT],
+                                              stdin=subprocess.PIPE,
+                                              stdout=subprocess.PIPE,
+                                              stderr=subprocess.DEVNULL,
+                                              close_fds=True)
+                helper.stdin.write(b'\n')
+                helper.stdin.flush()
+                line = helper.stdout.readline()
+            except OSError:
+                return None
+        if not line:
+            return None
+        try:
+            return base64.b64decode(line.strip(), validate=True).decode(ENCODING)
+        except ValueError:  # Includes binascii.Error and UnicodeDecodeError.
+            return None
 
     def paste_wsl():
-        # '-noprofile' speeds up load time
+        content = paste_helper()
+        if content is not None:
+            return content
+
+        # The helper died; fall back on a one-off PowerShell process.
         p = subprocess.Popen(['powershell.exe', '-noprofile', '-command', 'Get-Clipboard'],
                              stdout=subprocess.PIPE,
-                             stderr=subprocess.PIPE,
+                             stderr=subprocess.DEVNULL,
                              close_fds=True)
-        stdout, stderr = p.communicate()
-        # WSL appends "\r\n" to the contents.
-        return stdout[:-2].decode(ENCODING)
+        stdout, _ = p.communicate()
+        # WSL appends "\r\n" to the contents (sometimes just "\n").
+        if stdout.endswith(b'\r\n'):
+            stdout = stdout[:-2]
+        elif stdout.endswith(b'\n'):
+            stdout = stdout[:-1]
+        return stdout.decode(ENCODING)
 
     return copy_wsl, paste_wsl
 
@@ -511,31 +713,27 @@ def determine_clipboard():
     accordingly.
     '''
 
-    global Foundation, AppKit, qtpy, PyQt5
-
     # Setup for the CYGWIN platform:
-    if 'cygwin' in platform.system().lower():  # Cygwin has a variety of values returned by platform.system(), such as 'CYGWIN_NT-6.1'
+    if _IS_CYGWIN:
         if os.path.exists('/dev/clipboard'):
-            return init_dev_clipboard_clipboard()
+            return _init_clipboard("dev_clipboard")
 
     # Setup for the WINDOWS platform:
-    elif os.name == 'nt' or platform.system() == 'Windows':
-        return init_windows_clipboard()
+    elif _IS_WINDOWS:
+        return _init_clipboard("windows")
 
-    if platform.system() == 'Linux' and os.path.isfile('/proc/version'):
-        with open('/proc/version', 'r') as f:
-            if "microsoft" in f.read().lower():
-                return init_wsl_clipboard()
+    if _IS_WSL:
+        return _init_clipboard("wsl")
 
     # Setup for the MAC OS X platform:
-    if os.name == 'mac' or platform.system() == 'Darwin':
-        try:
-            import Foundation  # check if pyobjc is installed
-            import AppKit
-        except ImportError:
-            return init_osx_pbcopy_clipboard()
-        else:
-            return init_osx_pyobjc_clipboard()
+    if _IS_MACOS:
+        # check if pyobjc is installed
+        if _module_exists('Foundation') and _module_exists('AppKit'):
+            try:
+                return _init_clipboard("pyobjc")
+            except ImportError:
+                pass
+        return _init_clipboard("pbcopy")
 
     xdg_current_desktop = os.getenv('XDG_CURRENT_DESKTOP')
 
@@ -543,41 +741,66 @@ def determine_clipboard():
         # For GNOME
         if 'gnome' in xdg_current_desktop.lower() \
                 and _executable_exists("gpaste-client"):
-            return init_gpaste_clipboard()
+            return _init_clipboard("gpaste")
 
         # For KDE
         if 'kde' in xdg_current_desktop.lower() \
                 and _executable_exists("klipper") and _executable_exists("qdbus"):
-            return init_klipper_clipboard()
+            return _init_clipboard("klipper")
 
     # For wayland (generic):
     if (os.environ.get("WAYLAND_DISPLAY") and _executable_exists("wl-copy")):
-        return init_wl_clipboard()
+        return _init_clipboard("wl-clipboard")
 
     # For X11 (generic):
     if os.getenv("DISPLAY"):
         if _executable_exists("xsel"):
-            return init_xsel_clipboard()
+            return _init_clipboard("xsel")
         if _executable_exists("xclip"):
-            return init_xclip_clipboard()
+            return _init_clipboard("xclip")
+
+    # qtpy is a small abstraction layer that lets you write
+    # applications using a single api call to either PyQt or PySide.
+    # https://pypi.python.org/pypi/QtPy
+    # If qtpy isn't installed, init_qt_clipboard() falls back on PyQt5.
+    # find_spec() only says the package exists; importing it can still fail,
+    # e.g. when qtpy finds no Qt binding.
+    if _module_exists('qtpy') or _module_exists('PyQt5'):
+        try:
+            return _init_clipboard("qt")
+        except ImportError:
+            pass
 
-    try:
-        # qtpy is a small abstraction layer that lets you write
-        # applications using a single api call to either PyQt or PySide.
-        # https://pypi.python.org/pypi/QtPy
-        import qtpy  # check if qtpy is installed
-        return init_qt_clipboard()
-    except ImportError:
-        pass
-
-    # If qtpy isn't installed, fall back on importing PyQt5
-    try:
-        import PyQt5  # check if PyQt5 is installed
-        return init_qt_clipboard()
-    except ImportError:
-        pass
+    return _init_clipboard("no")
+
+
+_CLIPBOARD_TYPES = types.MappingProxyType({
+    "gpaste": init_gpaste_clipboard,
+    "pbcopy": init_osx_pbcopy_clipboard,
+    "pyobjc": init_osx_pyobjc_clipboard,
+    "qt": init_qt_clipboard,  # TODO - split this into 'qtpy' and 'pyqt5'
+    "xclip": init_xclip_clipboard,
+    "xsel": init_xsel_clipboard,
+    "wl-clipboard": init_wl_clipboard,
+    "wl-clipboard-watch": functools.partial(init_wl_clipboard, watch=True),
+    "klipper": init_klipper_clipboard,
+    "windows": init_windows_clipboard,
+    "wsl": init_wsl_clipboard,
+    "dev_clipboard": init_dev_clipboard_clipboard,
+    "no": init_no_clipboard,
+})
 
-    return init_no_clipboard()
+
+# Memoized results of the init_*_clipboard() functions, keyed by the names in
+# _CLIPBOARD_TYPES, so that selecting the same mechanism again reuses its
+# copy() and paste() functions instead of setting the backend up from scratch.
+_init_cache = {}
+
+
+def _init_clipboard(clipboard):
+    if clipboard not in _init_cache:
+        _init_cache[clipboard] = _CLIPBOARD_TYPES[clipboard]()
+    return _init_cache[clipboard]
 
 
 def set_clipboard(clipboard):
@@ -591,32 +814,27 @@ def set_clipboard(clipboard):
         - qt
         - xclip
         - xsel
+        - wl-clipboard
+        - wl-clipboard-watch (like wl-clipboard, but keeps a "wl-paste --watch"
+          process running in the background so paste() doesn't need to run
+          wl-paste every time)
         - klipper
         - windows (default on Windows)
         - no (this is what is set when no clipboard mechanism can be found)
     '''
     global copy, paste
 
-    clipboard_types = {
-        "gpaste": init_gpaste_clipboard,
-        "pbcopy": init_osx_pbcopy_clipboard,
-        "pyobjc": init_osx_pyobjc_clipboard,
-        "qt": init_qt_clipboard,  # TODO - split this into 'qtpy' and 'pyqt5'
-        "xclip": init_xclip_clipboard,
-        "xsel": init_xsel_clipboard,
-        "wl-clipboard": init_wl_clipboard,
-        "klipper": init_klipper_clipboard,
-        "windows": init_windows_clipboard,
-        "wsl": init_wsl_clipboard,
-        "dev_clipboard": init_dev_clipboard_clipboard,
-        "no": init_no_clipboard,
-    }
-
-    if clipboard not in clipboard_types:
-        raise ValueError('Argument must be one of %s' % (', '.join([repr(_) for _ in clipboard_types.keys()])))
+    if clipboard not in _CLIPBOARD_TYPES:
+        raise ValueError('Argument must be one of %s' % (', '.join([repr(_) for _ in _CLIPBOARD_TYPES.keys()])))
 
     # Sets pyperclip's copy() and paste() functions:
-    copy, paste = clipboard_types[clipboard]()
+    copy, paste = _init_clipboard(clipboard)
+
+
+# The (copy, paste) pair picked by determine_clipboard() for the lazy loading
+# stubs. It is cached so that code holding on to the stubs themselves (e.g.
+# after "from pyperclip import paste") doesn't probe the system on every call.
+_resolved = None
 
 
 def lazy_load_stub_copy(text):
@@ -636,8 +854,10 @@ def lazy_load_stub_copy(text):
     will fall back on whatever clipboard mechanism that determine_clipboard()
     automatically chooses.
     '''
-    global copy, paste
-    copy, paste = determine_clipboard()
+    global copy, paste, _resolved
+    if _resolved is None:
+        _resolved = determine_clipboard()
+    copy, paste = _resolved
     return copy(text)
 
 
@@ -658,8 +878,10 @@ def lazy_load_stub_paste():
     will fall back on whatever clipboard mechanism that determine_clipboard()
     automatically chooses.
     '''
-    global copy, paste
-    copy, paste = determine_clipboard()
+    global copy, paste, _resolved
+    if _resolved is None:
+        _resolved = determine_clipboard()
+    copy, paste = _resolved
     return paste()
 
 
@@ -673,6 +895,28 @@ def is_available():
 copy, paste = lazy_load_stub_copy, lazy_load_stub_paste
 
 
+_PASTE_CACHE_TTL = 0.05
+
+
+def _paste_poller():
+    # Returns a function for the polling loops of waitForPaste() and
+    # waitForNewPaste(). It reuses its last paste() result for a short while
+    # instead of querying the clipboard (often by spawning a process) every
+    # 10ms. The first call always reads the clipboard.
+    last_poll = None
+    value = None
+
+    def poll():
+        nonlocal last_poll, value
+        now = time.monotonic()
+        if last_poll is None or now - last_poll >= _PASTE_CACHE_TTL:
+            value = paste()
+            last_poll = now
+        return value
+
+    return poll
+
+
 def waitForPaste(timeout=None):
     """This function call blocks until a non-empty text string exists on the
     clipboard. It returns this text.
@@ -681,8 +925,9 @@ def waitForPaste(timeout=None):
     a number of seconds that has elapsed without non-empty text being put on
     the clipboard."""
     startTime = time.time()
+    poll = _paste_poller()
     while True:
-        clipboardText = paste()
+        clipboardText = poll()
         if clipboardText != '':
             return clipboardText
         time.sleep(0.01)
@@ -700,9 +945,10 @@ def waitForNewPaste(timeout=None):
     a number of seconds that has elapsed without non-empty text being put on
     the clipboard."""
     startTime = time.time()
-    originalText = paste()
+    poll = _paste_poller()
+    originalText = poll()
     while True:
-        currentText = paste()
+        currentText = poll()
         if currentText != originalText:
             return currentText
         time.sleep(0.01)
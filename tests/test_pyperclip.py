@@ -3,25 +3,46 @@ import string
 import unittest
 import random
 import os
+import sys
 import platform
+import threading
+from unittest import mock
 
 #import sys
 #sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-from pyperclip import _executable_exists, HAS_DISPLAY
-from pyperclip import (init_osx_pbcopy_clipboard, init_osx_pyobjc_clipboard,
+import pyperclipfix
+from pyperclipfix import _executable_exists
+from pyperclipfix import (init_osx_pbcopy_clipboard, init_osx_pyobjc_clipboard,
                                   init_dev_clipboard_clipboard,
                                   init_qt_clipboard,
                                   init_xclip_clipboard, init_xsel_clipboard,
                                   init_wl_clipboard,
                                   init_klipper_clipboard, init_no_clipboard)
-from pyperclip import init_windows_clipboard
-from pyperclip import init_wsl_clipboard
+from pyperclipfix import init_windows_clipboard
+from pyperclipfix import init_wsl_clipboard
 
-from pyperclip import PyperclipException
+from pyperclipfix import PyperclipException
+
+HAS_DISPLAY = os.getenv("DISPLAY")
 
 random.seed(42) # Make the "random" tests reproducible.
 
+
+def init_memory_clipboard():
+    # An in-memory clipboard for testing the logic around the backends.
+    contents = ['']
+    calls = {'paste': 0}
+
+    def copy_memory(text):
+        contents[0] = text
+
+    def paste_memory():
+        calls['paste'] += 1
+        return contents[0]
+
+    return copy_memory, paste_memory, calls
+
 class _TestClipboard(unittest.TestCase):
     clipboard = None
     supports_unicode = True
@@ -80,6 +101,17 @@ class _TestClipboard(unittest.TestCase):
         self.copy(msg)
         self.assertEqual(self.paste(), msg)
 
+    def test_copy_paste_bytes(self):
+        if not self.supports_unicode:
+            raise unittest.SkipTest()
+        msg = u"ಠ_ಠ"
+        self.copy(msg.encode('utf-8'))
+        self.assertEqual(self.paste(), msg)
+
+    def test_copy_invalid_bytes(self):
+        with self.assertRaises(PyperclipException):
+            self.copy(b'\xff\xfe')
+
     def test_non_str(self):
         # Test copying an int.
         self.copy(42)
@@ -176,5 +208,124 @@ class TestNoClipboard(unittest.TestCase):
             self.paste()
 
 
+class TestStringifyText(unittest.TestCase):
+    def test_bytes(self):
+        msg = u"ಠ_ಠ"
+        self.assertEqual(pyperclipfix._stringifyText(msg.encode('utf-8')), msg)
+        data = msg.encode('utf-8')
+        self.assertIs(pyperclipfix._encodeText(data), data)
+        self.assertEqual(pyperclipfix._encodeText(42), b'42')
+
+    def test_invalid_bytes(self):
+        # Every backend rejects invalid UTF-8, whether it needs str or bytes.
+        with self.assertRaises(PyperclipException):
+            pyperclipfix._stringifyText(b'\xff\xfe')
+        with self.assertRaises(PyperclipException):
+            pyperclipfix._encodeText(b'\xff\xfe')
+        with self.assertRaises(PyperclipException):
+            pyperclipfix._encodeText(None)
+
+
+class TestWaitForPaste(unittest.TestCase):
+    def setUp(self):
+        self.copy, paste, self.calls = init_memory_clipboard()
+        patcher = mock.patch.object(pyperclipfix, 'paste', paste)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_waitForPaste_reads_fresh(self):
+        self.copy('first')
+        self.assertEqual(pyperclipfix.waitForPaste(), 'first')
+        self.copy('second')
+        self.assertEqual(pyperclipfix.waitForPaste(), 'second')
+
+    def test_waitForPaste_timeout(self):
+        with self.assertRaises(pyperclipfix.PyperclipTimeoutException):
+            pyperclipfix.waitForPaste(0.3)
+        # Polls within the cache lifetime reuse the last result.
+        self.assertLessEqual(self.calls['paste'], 0.3 / pyperclipfix._PASTE_CACHE_TTL + 2)
+
+    def test_waitForNewPaste(self):
+        self.copy('first')
+        self.assertEqual(pyperclipfix.waitForPaste(), 'first')
+        timer = threading.Timer(0.1, self.copy, ['second'])
+        timer.start()
+        self.addCleanup(timer.cancel)
+        self.assertEqual(pyperclipfix.waitForNewPaste(5), 'second')
+
+
+class TestMemoization(unittest.TestCase):
+    def setUp(self):
+        patchers = [
+            mock.patch.object(pyperclipfix, '_init_cache', {}),
+            mock.patch.object(pyperclipfix, '_resolved', None),
+            mock.patch.object(pyperclipfix, 'copy', pyperclipfix.lazy_load_stub_copy),
+            mock.patch.object(pyperclipfix, 'paste', pyperclipfix.lazy_load_stub_paste),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_set_clipboard_reuses_functions(self):
+        pyperclipfix.set_clipboard('no')
+        first = (pyperclipfix.copy, pyperclipfix.paste)
+        pyperclipfix.set_clipboard('no')
+        self.assertIs(pyperclipfix.copy, first[0])
+        self.assertIs(pyperclipfix.paste, first[1])
+
+    def test_set_clipboard_invalid(self):
+        with self.assertRaises(ValueError):
+            pyperclipfix.set_clipboard('not-a-clipboard')
+
+    def test_lazy_stubs_determine_once(self):
+        copy, paste, _ = init_memory_clipboard()
+        with mock.patch.object(pyperclipfix, 'determine_clipboard',
+                               return_value=(copy, paste)) as determine:
+            # Callers may hold on to the stubs, e.g. after "from pyperclip import paste".
+            pyperclipfix.lazy_load_stub_copy('foo')
+            self.assertEqual(pyperclipfix.lazy_load_stub_paste(), 'foo')
+            pyperclipfix.lazy_load_stub_copy('bar')
+        self.assertEqual(determine.call_count, 1)
+        self.assertIs(pyperclipfix.copy, copy)
+        self.assertIs(pyperclipfix.paste, paste)
+        self.assertTrue(pyperclipfix.is_available())
+
+    def test_executable_exists_cached(self):
+        _executable_exists.cache_clear()
+        self.addCleanup(_executable_exists.cache_clear)
+        _executable_exists('pyperclip-missing-executable')
+        _executable_exists('pyperclip-missing-executable')
+        info = _executable_exists.cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+        _executable_exists.cache_clear()
+        self.assertEqual(_executable_exists.cache_info().currsize, 0)
+
+
+class TestDetermineClipboard(unittest.TestCase):
+    def setUp(self):
+        patchers = [
+            mock.patch.object(pyperclipfix, '_init_cache', {}),
+            mock.patch.object(pyperclipfix, '_IS_CYGWIN', False),
+            mock.patch.object(pyperclipfix, '_IS_WINDOWS', False),
+            mock.patch.object(pyperclipfix, '_IS_WSL', False),
+            mock.patch.object(pyperclipfix, '_IS_MACOS', False),
+            mock.patch.dict(os.environ),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        for name in ('XDG_CURRENT_DESKTOP', 'WAYLAND_DISPLAY', 'DISPLAY'):
+            os.environ.pop(name, None)
+
+    def test_unimportable_qt(self):
+        # qtpy can be installed without any Qt binding it could use.
+        with mock.patch.object(pyperclipfix, '_module_exists', return_value=True), \
+                mock.patch.dict(sys.modules, {'qtpy': None, 'qtpy.QtWidgets': None,
+                                              'PyQt5': None, 'PyQt5.QtWidgets': None}):
+            copy, paste = pyperclipfix.determine_clipboard()
+        with self.assertRaises(PyperclipException):
+            copy('foo')
+
+
 if __name__ == '__main__':
     unittest.main()